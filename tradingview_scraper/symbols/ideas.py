@@ -1,17 +1,20 @@
 
-import requests
 from time import sleep
 
 from bs4 import BeautifulSoup
 
 
-from tradingview_scraper.symbols.utils import save_csv_file, save_json_file, generate_user_agent
+from tradingview_scraper.symbols.utils import (
+    save_csv_file, save_json_file, save_csv_stream, save_json_stream, get_session, json_loads
+)
 
 class Ideas:
-    def __init__(self, export_result=False, export_type='json'):
+    __slots__ = ('export_result', 'export_type', 'page_delay')
+
+    def __init__(self, export_result=False, export_type='json', page_delay=5):
         self.export_result = export_result
         self.export_type = export_type
-        self.headers = {"user-agent": generate_user_agent()}
+        self.page_delay = page_delay
         
     def scrape(
         self,
@@ -52,34 +55,99 @@ class Ideas:
 
         Notes
         -----
-        The method includes a delay of 5 seconds between requests to avoid overwhelming
-        the server with rapid requests.
+        The method waits `page_delay` seconds (5 by default) between pages to avoid
+        overwhelming the server with rapid requests; set it to 0 to disable the delay.
         """
-        
-        pageList = range(startPage, endPage + 1)
+        articles = list(self.iter_scrape(symbol=symbol, startPage=startPage, endPage=endPage, sort=sort))
 
-        articles = []
-        
-        for page in pageList:
+        # Save results
+        if self.export_result == True:
+            self._export(data=articles, symbol=symbol)
+            
+        return articles
+
+
+    def iter_scrape(
+        self,
+        symbol: str = "BTCUSD",
+        startPage: int = 1,
+        endPage: int = 1,
+        sort: str = "popular"
+    ):
+        """
+        Lazily yield trading ideas for a specified symbol, one page at a time.
+
+        This is the generator behind `scrape`: each page is only requested once the
+        ideas of the previous page have been consumed, so callers can stop early or
+        process large page ranges without holding every idea in memory. Results are
+        not exported.
+
+        Parameters
+        ----------
+        symbol : str, optional
+            The trading symbol for which to scrape ideas. Defaults to "BTCUSD".
+        startPage : int, optional
+            The page number where the scraper should start. Defaults to 1.
+        endPage : int, optional
+            The page number where the scraper should end. Defaults to 1.
+        sort : str, optional
+            The sorting criteria for the ideas. Can be either 'popular' or 'recent'. Defaults to 'popular'.
+
+        Yields
+        ------
+        dict
+            A single scraped trading idea.
+        """
+        for page in range(startPage, endPage + 1):
 
             if sort == "popular":
-                articles.extend(self.scrape_popular_ideas(symbol, page))
+                yield from self.scrape_popular_ideas(symbol, page)
             elif sort == "recent":
-                articles.extend(self.scrape_recent_ideas(symbol, page))
+                yield from self.scrape_recent_ideas(symbol, page)
             else:
                 print("[ERROR] sort argument must be one 'popular' or 'recent'")
             
             print(f"[INFO] Page {page} scraped successfully")
 
-            # Wait 5 seconds before going to the next page
-            if len(pageList) > 1 and page<len(pageList):
-                sleep(5)
+            # Wait before going to the next page
+            if self.page_delay > 0 and page < endPage:
+                sleep(self.page_delay)
 
-        # Save results
-        if self.export_result == True:
-            self._export(data=articles, symbol=symbol)
-            
-        return articles
+
+    def export_stream(
+        self,
+        symbol: str = "BTCUSD",
+        startPage: int = 1,
+        endPage: int = 1,
+        sort: str = "popular"
+    ):
+        """
+        Scrape trading ideas and write them to an export file as each page arrives.
+
+        Unlike `scrape` with `export_result=True`, the ideas are never collected in
+        memory, which keeps large page ranges cheap. The file format follows
+        `export_type`.
+
+        Parameters
+        ----------
+        symbol : str, optional
+            The trading symbol for which to scrape ideas. Defaults to "BTCUSD".
+        startPage : int, optional
+            The page number where the scraper should start. Defaults to 1.
+        endPage : int, optional
+            The page number where the scraper should end. Defaults to 1.
+        sort : str, optional
+            The sorting criteria for the ideas. Can be either 'popular' or 'recent'. Defaults to 'popular'.
+
+        Returns
+        -------
+        int
+            The number of ideas written.
+        """
+        ideas = self.iter_scrape(symbol=symbol, startPage=startPage, endPage=endPage, sort=sort)
+        if self.export_type == "csv":
+            return save_csv_stream(rows=ideas, symbol=symbol, data_category='ideas')
+        return save_json_stream(rows=ideas, symbol=symbol, data_category='ideas')
 
 
     def _export(self, data, symbol):
@@ -177,9 +245,8 @@ class Ideas:
             symbol_payload = "/"
 
         # Fetch the page as plain HTML text
-        response = requests.get(
-            f"https://www.tradingview.com/symbols{symbol_payload}ideas/page-{page}/?component-data-only=1&sort=recent",
-            headers=self.headers
+        response = get_session().get(
+            f"https://www.tradingview.com/symbols{symbol_payload}ideas/page-{page}/?component-data-only=1&sort=recent"
         ).text
 
         # Use BeautifulSoup to parse the HTML
@@ -232,11 +299,15 @@ class Ideas:
         else:
             url = f"https://www.tradingview.com/symbols{symbol_payload}ideas/page-{page}/?sort=recent&component-data-only=1&sort=recent"
 
-        response = requests.get(url, headers=self.headers)
+        response = get_session().get(url)
         if response.status_code != 200:
             return []
 
-        response_json = response.json()
+        try:
+            response_json = json_loads(response.content)
+        except ValueError:
+            # A non-JSON body (e.g. a captcha page) is treated like a failed request
+            return []
         items = response_json.get("data", {}).get("ideas", {}).get("data", {}).get("items", [])
         
         return [item for item in items if item.pop("symbol", None) is not None]
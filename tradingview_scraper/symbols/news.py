@@ -1,23 +1,40 @@
 
 from bs4 import BeautifulSoup
 import requests
-import pkg_resources
-import json
-import os
+from operator import itemgetter
 
 
-from tradingview_scraper.symbols.utils import save_csv_file, save_json_file, generate_user_agent
+from tradingview_scraper.symbols.utils import (
+    save_csv_file, save_json_file, get_session, json_loads,
+    load_exchanges, load_languages, load_news_providers, load_areas
+)
+
+
+# Sort option -> (key function, reverse)
+_SORT_TABLE = {
+    "latest": (itemgetter('published'), True),
+    "oldest": (itemgetter('published'), False),
+    "most_urgent": (itemgetter('urgency'), True),
+    "least_urgent": (itemgetter('urgency'), False),
+}
+
+_SECTIONS = frozenset(["all", "esg", "financial_statement", "press_release"])
+
 
 class NewsScraper:
+    __slots__ = (
+        'export_result', 'export_type',
+        'exchanges', 'languages', 'news_providers', 'areas'
+    )
+
     def __init__(self, export_result=False, export_type='json'):
         self.export_result = export_result
         self.export_type = export_type
-        self.headers = {"user-agent": generate_user_agent()}
 
-        self.exchanges = self._load_exchanges()
-        self.languages = self._load_languages()
-        self.news_providers = self._load_news_providers()
-        self.areas = self._load_areas()
+        self.exchanges = load_exchanges()
+        self.languages = load_languages()
+        self.news_providers = load_news_providers()
+        self.areas = load_areas()
 
     def validate_inputs(self, **kwargs):
         symbol = kwargs.get('symbol')
@@ -43,10 +60,10 @@ class NewsScraper:
         if area and area not in self.areas:
             raise ValueError(f"Invalid area! Please check 'the available options' at the link below:\n\thttps://github.com/mnwato/tradingview-scraper/blob/main/tradingview_scraper/data/areas.json")
 
-        if section not in ["all", "esg", "financial_statement", "press_release"]:
+        if section not in _SECTIONS:
             raise ValueError("Invalid section! It must be 'all' or 'esg'.")
 
-        if sort not in ["latest", "oldest", "most_urgent", "least_urgent"]:
+        if sort not in _SORT_TABLE:
             raise ValueError("Invalid sort option! It must be one of 'latest', 'oldest', 'most_urgent', or 'least_urgent'.")
 
         if language not in self.languages:
@@ -79,7 +96,7 @@ class NewsScraper:
         # construct the URL
         url = f"https://tradingview.com{story_path}"
         
-        response = requests.get(url, headers=self.headers)
+        response = get_session().get(url)
         response.raise_for_status()
 
         # Use BeautifulSoup to parse the HTML
@@ -185,7 +202,7 @@ class NewsScraper:
         Raises:
             ValueError: If the provided section, sort option, language, or exchange 
                         is not supported.
-            RuntimeError: If an error occurs during the scraping process.
+            RuntimeError: If the request fails or the response is not valid JSON.
             HTTPError: If the HTTP request returns an error response.
 
         Example:
@@ -219,10 +236,10 @@ class NewsScraper:
         url = f"https://news-headlines.tradingview.com/v2/view/headlines/symbol?client=web&lang={language}&area={area_code}&provider={provider}&section={section}&streaming=&symbol={exchange}:{symbol}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = get_session().get(url)
             response.raise_for_status()  # Raises HTTPError for bad responses (4xx and 5xx)
             
-            response_json = response.json()
+            response_json = json_loads(response.content)
             items = response_json.get('items', [])
             
             if not items:
@@ -240,26 +257,15 @@ class NewsScraper:
             if response.status_code == 400:
                 raise ValueError("Bad request: The server could not understand the request.") from http_err
             raise  # Propagate other HTTP errors
-        except Exception as err:
+        except (requests.RequestException, ValueError) as err:
+            # Network failures and undecodable responses; programming errors propagate as-is
             raise RuntimeError("An error occurred while scraping news.") from err
 
+    @staticmethod
     def _sort_news(news_list, sort):
-      # Sort by latest published date
-      if sort=="latest":
-        news_list = sorted(news_list, key=lambda x: x['published'], reverse=True)
-      
-      # Sort by oldest published date
-      elif sort=="oldest":
-        news_list = sorted(news_list, key=lambda x: x['published'], reverse=False)
-        
-      # Sort by most urgent
-      elif sort=="most_urgent":
-        news_list = sorted(news_list, key=lambda x: x['urgency'], reverse=True)
-      
-      # Sort by least urgent
-      elif sort=="least_urgent":
-        news_list = sorted(news_list, key=lambda x: x['urgency'], reverse=False)
-      
+      # Sort in place by the key and direction registered for the sort option
+      key, reverse = _SORT_TABLE[sort]
+      news_list.sort(key=key, reverse=reverse)
       return news_list
 
 
@@ -272,90 +278,3 @@ class NewsScraper:
         elif self.export_type == "csv":
             save_csv_file(data=data, symbol=symbol, data_category=data_category)
 
-
-    def _load_languages(self):
-        """Load languages from a specified file.
-
-        Returns:
-            list: A list of languages loaded from the file.
-
-        Raises:
-            IOError: If there is an error reading the file.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/languages.json')
-        if not os.path.exists(path):
-            print(f"[ERROR] Languages file not found at {path}.")
-            return []
-        try:
-            with open(path, 'r') as f:
-                exchanges = json.load(f)
-            return list(exchanges.values())
-        except IOError as e:
-            print(f"[ERROR] Error reading languages file: {e}")
-            return []
-
-
-    def _load_exchanges(self):
-        """Load exchanges from a specified file.
-
-        Returns:
-            list: A list of exchanges loaded from the file. Returns an empty list if the file is not found.
-
-        Raises:
-            IOError: If there is an error reading the file.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/exchanges.txt')
-        if not os.path.exists(path):
-            print(f"[ERROR] Exchanges file not found at {path}.")
-            return []
-        try:
-            with open(path, 'r') as f:
-                exchanges = f.readlines()
-            return [exchange.strip() for exchange in exchanges]
-        except IOError as e:
-            print(f"[ERROR] Error reading exchanges file: {e}")
-            return []
-
-
-    def _load_news_providers(self):
-        """Load news providers from a specified file.
-
-        Returns:
-            list: A list of news providers loaded from the file.
-
-        Raises:
-            IOError: If there is an error reading the file.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/news_providers.txt')
-        if not os.path.exists(path):
-            print(f"[ERROR] News provider file not found at {path}.")
-            return []
-        try:
-            with open(path, 'r') as f:
-                providers = f.readlines()
-            return [provider.strip() for provider in providers]
-        except IOError as e:
-            print(f"[ERROR] Error reading providers file: {e}")
-            return []
-
-    
-    def _load_areas(self) -> list:
-        """Load areas from a specified file.
-
-        Returns:
-            list: A list of areas loaded from the file.
-
-        Raises:
-            IOError: If there is an error reading the file.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/areas.json')
-        if not os.path.exists(path):
-            print(f"[ERROR] Areas file not found at {path}.")
-            return []
-        try:
-            with open(path, 'r') as f:
-                areas = json.load(f)
-            return areas
-        except IOError as e:
-            print(f"[ERROR] Error reading areas file: {e}")
-            return []
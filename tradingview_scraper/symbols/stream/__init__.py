@@ -0,0 +1,23 @@
+import importlib
+
+
+# Public names resolved on first access, so importing the package does not
+# pull in the websocket client until streaming is actually used.
+_LAZY = {
+    'RealTimeData': '.price',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
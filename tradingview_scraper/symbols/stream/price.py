@@ -1,22 +1,113 @@
 
-from websocket import create_connection, WebSocketConnectionClosedException
-import json
+import asyncio
+from websocket import ABNF, create_connection, WebSocketConnectionClosedException
 import string
-import re
+import functools
 import logging
+import re
 import signal
+import socket
 import requests
 import secrets
-from typing import List
-from time import sleep
-import time
+import select
+import ssl
+from typing import List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+
+from tradingview_scraper.symbols._cache import TTLCache
+from tradingview_scraper.symbols.utils import get_session, json_dumps, json_dumps_bytes, json_loads
+
+logger = logging.getLogger(__name__)
+
+# 'EXCHANGE:SYMBOL', captured as (exchange, symbol)
+_SYMBOL_RE = re.compile(r'\A([^:]+):([^:]+)\Z')
+
+# (exchange, symbol) -> True if valid, or the error message if the scanner rejected it
+_symbol_checks = TTLCache(ttl=3600)
+
+# Marks the end of the packet generator in get_data_async, since a packet may decode to None
+_END = object()
+
+# Maps every byte value to a lowercase letter, so one call to the OS RNG yields a whole session id
+_SESSION_ALPHABET = bytes(ord(string.ascii_lowercase[i % 26]) for i in range(256))
+
+
+def _frame(payload: bytes) -> bytes:
+    """
+    Prefixes a UTF-8 encoded message with its '~m~<length>~m~' header.
+    """
+    # The length prefix counts characters, which only differs from bytes for non-ASCII payloads
+    length = len(payload) if payload.isascii() else len(payload.decode())
+    return b"~m~%d~m~%b" % (length, payload)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+def _envelope(func: str, param_list: list) -> bytes:
+    """
+    Builds a framed '~m~<length>~m~<json>' message directly as bytes.
+
+    Args:
+        func (str): The function name to be called.
+        param_list (list): The list of parameters for the function.
+
+    Returns:
+        bytes: The framed message, ready to be sent without re-encoding.
+    """
+    return _frame(json_dumps_bytes({"m": func, "p": param_list}))
+
+
+# Session-independent control messages, framed once at import time
+_SET_AUTH_TOKEN_MESSAGE = _envelope("set_auth_token", ["unauthorized_user_token"])
+_SET_LOCALE_MESSAGE = _envelope("set_locale", ["en", "US"])
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_symbol_json(exchange_symbol: str) -> str:
+    """
+    Serializes the symbol descriptor used to resolve a chart symbol, once per symbol.
+    """
+    return json_dumps({"adjustment": "splits", "symbol": exchange_symbol})
+
+
+def _iter_frames(buffer: str):
+    """
+    Splits a buffer of concatenated TradingView messages into their payloads.
+
+    Each message is framed as '~m~<length>~m~<payload>', so the length is read
+    between the two markers and the payload is sliced directly. If the length
+    does not line up with the next header (e.g. it was counted over characters
+    Python sizes differently), the payload runs up to the next header instead.
+
+    Args:
+        buffer (str): One or more framed messages.
+
+    Yields:
+        str: Each message payload, in order.
+    """
+    size = len(buffer)
+    position = 0
+    while buffer.startswith("~m~", position):
+        header_end = buffer.find("~m~", position + 3)
+        if header_end == -1:
+            return
+        start = header_end + 3
+        position = start + int(buffer[position + 3:header_end])
+        if position != size and not buffer.startswith("~m~", position):
+            next_header = buffer.find("~m~", start)
+            position = next_header if next_header != -1 else size
+        yield buffer[start:position]
 
 
 class RealTimeData:
+    _QUOTE_FIELDS = ("ch", "chp", "current_session", "description", "local_description",
+                     "language", "exchange", "fractional", "is_tradable", "lp",
+                     "lp_time", "minmov", "minmove2", "original_name", "pricescale",
+                     "pro_name", "short_name", "type", "update_mode", "volume",
+                     "currency_code", "rchp", "rtc")
+    # The fields as comma-separated JSON strings, without the enclosing brackets
+    _QUOTE_FIELDS_JSON = json_dumps_bytes(_QUOTE_FIELDS)[1:-1]
+    # The Volume study script and its inputs, serialized once like the quote fields
+    _VOLUME_STUDY_JSON = json_dumps_bytes(["Volume@tv-basicstudies-246", {"length": 20, "col_prev_close": "false"}])[1:-1]
+
     def __init__(self):
         """
         Initializes the RealTimeData class, setting up the WebSocket connection 
@@ -30,25 +121,30 @@ class RealTimeData:
             "Host": "data.tradingview.com",
             "Origin": "https://www.tradingview.com",
             "Pragma": "no-cache",
-            "Sec-WebSocket-Extensions": "permessage-deflate; client_max_window_bits",
             "Upgrade": "websocket",
             "User-Agent": "Mozilla/5.0 (Windows NT 6.3; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
         }
         self.ws_url = "wss://data.tradingview.com/socket.io/websocket?from=screener%2F&date={date}"
         self.ws_url = "wss://data.tradingview.com/socket.io/websocket?from=screener%2F"
         self.validate_url = "https://scanner.tradingview.com/symbol?symbol={exchange}%3A{symbol}&fields=market&no_404=false"
-        self.ws = create_connection(self.ws_url, headers=self.request_header)
+        self._drain_error = None  # A read error held back by _drain until its messages are consumed
+        # websocket-client decodes every text frame itself, so its extra UTF-8 validation pass is skipped
+        self.ws = create_connection(self.ws_url, headers=self.request_header, skip_utf8_validation=True)
 
     def validate_symbols(self, exchange_symbol):
         """
         Validates the provided exchange symbols.
 
+        Scanner answers are remembered for an hour, so symbols that were already
+        checked are not requested again.
+
         Args:
             exchange_symbol (str or list): A single symbol or a list of symbols 
                                             in the format 'EXCHANGE:SYMBOL'.
 
         Raises:
-            Exception: If the symbol format is invalid or if the symbol is not valid.
+            ValueError: If the symbol format is invalid or if any symbol is not valid.
+                        Invalid symbols are reported together in a single error.
 
         Returns:
             bool: True if all symbols are valid.
@@ -58,31 +154,60 @@ class RealTimeData:
         
         if isinstance(exchange_symbol, str):
             exchange_symbol = [exchange_symbol]
-            
+
+        pairs = []
         for item in exchange_symbol:
-            if len(item.split(':')) != 2:
+            match = _SYMBOL_RE.match(item)
+            if match is None:
                 raise ValueError(f"Invalid symbol format '{item}'. Must be like 'BINANCE:BTCUSDT'")
-
-            exchange, symbol = item.split(':')
-            retries = 3
-            for attempt in range(retries):
-                try:
-                    res = requests.get(self.validate_url.format(exchange=exchange, symbol=symbol))
-                    res.raise_for_status()
-                    break  # Exit the retry loop on success
-
-                except requests.RequestException as e:
-                    if res.status_code == 404:
-                        raise ValueError(f"Invalid symbol '{item}' after {retries} attempts")
-                    else:
-                        logging.warning(f"Attempt {attempt + 1} failed to validate symbol '{item}': {e}")
-
-                    if attempt < retries - 1:
-                        time.sleep(1)  # Optional: wait before retrying
-                    else:
-                        raise ValueError(f"Invalid symbol '{item}' after {retries} attempts")
+            pairs.append(match.groups())
+
+        # Symbols checked recently are answered from the cache instead of the scanner
+        known = {pair: _symbol_checks.get(pair) for pair in pairs}
+        unchecked = [pair for pair, result in known.items() if result is None]
+
+        # The checks are network-bound, so run them side by side over the shared session
+        futures = {}
+        if unchecked:
+            with ThreadPoolExecutor(max_workers=min(8, len(unchecked))) as executor:
+                futures = {pair: executor.submit(self._validate_symbol, *pair) for pair in unchecked}
+
+        errors = []
+        for pair, result in known.items():
+            if pair in futures:
+                error = futures[pair].exception()
+                if error is not None:
+                    errors.append(str(error))
+            elif result is not True:
+                errors.append(result)
+
+        if errors:
+            raise ValueError("; ".join(errors))
         return True
 
+    def _validate_symbol(self, exchange: str, symbol: str) -> None:
+        """
+        Checks a single symbol against the TradingView scanner.
+
+        Transient failures are retried with backoff by the shared HTTP session.
+        Definitive answers are remembered in `_symbol_checks`.
+
+        Raises:
+            ValueError: If the symbol is not valid or could not be validated.
+        """
+        item = f"{exchange}:{symbol}"
+        res = None
+        try:
+            res = get_session().get(self.validate_url.format(exchange=exchange, symbol=symbol), timeout=5)
+            res.raise_for_status()
+        except requests.RequestException as e:
+            if res is not None and res.status_code in (400, 404):
+                message = f"Invalid symbol '{item}'"
+                _symbol_checks.set((exchange, symbol), message)
+                raise ValueError(message) from e
+            raise ValueError(f"Failed to validate symbol '{item}': {e}") from e
+        _symbol_checks.set((exchange, symbol), True)
+
 
     def generate_session(self, prefix: str) -> str:
         """
@@ -94,7 +219,7 @@ class RealTimeData:
         Returns:
             str: A session identifier consisting of the prefix and a random string.
         """
-        random_string = ''.join(secrets.choice(string.ascii_lowercase) for _ in range(12))
+        random_string = secrets.token_bytes(12).translate(_SESSION_ALPHABET).decode()
         return prefix + random_string
 
 
@@ -108,8 +233,7 @@ class RealTimeData:
         Returns:
             str: The message prefixed with its length.
         """
-        message_length = len(message)
-        return f"~m~{message_length}~m~{message}"
+        return _frame(message.encode()).decode()
 
 
     def construct_message(self, func: str, param_list: list) -> str:
@@ -123,7 +247,7 @@ class RealTimeData:
         Returns:
             str: The constructed JSON message.
         """
-        return json.dumps({"m": func, "p": param_list}, separators=(',', ':'))
+        return json_dumps({"m": func, "p": param_list})
 
     def create_message(self, func: str, param_list: list) -> str:
         """
@@ -136,7 +260,7 @@ class RealTimeData:
         Returns:
             str: The complete message ready to be sent.
         """
-        return self.prepend_header(self.construct_message(func, param_list))
+        return _envelope(func, param_list).decode()
 
     def send_message(self, func: str, args: list):
         """
@@ -146,70 +270,117 @@ class RealTimeData:
             func (str): The function name to be called.
             args (list): The arguments for the function.
         """
-        message = self.create_message(func, args)
-        logging.debug(f"Sending message: {message}")
+        message = _envelope(func, args)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending message: %s", message.decode())
         try:
             self.ws.send(message)
         except Exception as e:
-            logging.error(f"Failed to send message: {e}")
+            logger.error("Failed to send message: %s", e)
+
+    def send_batch(self, messages: List[Union[Tuple[str, list], bytes]]):
+        """
+        Sends several messages to the WebSocket server in a single frame.
+
+        The framed messages are concatenated, which TradingView splits on their
+        length prefixes just like the batches it sends back.
+
+        Args:
+            messages (List[Union[Tuple[str, list], bytes]]): (function name, arguments)
+                pairs or already framed messages, in order.
+        """
+        batch = b"".join([
+            message if isinstance(message, bytes) else _envelope(*message)
+            for message in messages
+        ])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending batch: %s", batch.decode())
+        try:
+            self.ws.send(batch)
+        except Exception as e:
+            logger.error("Failed to send batch: %s", e)
         
     
-    def get_ohlcv(self, exchange_symbol: str):
+    def get_ohlcv(self, exchange_symbol: Union[str, List[str]]):
         """
-        Returns a generator that yields OHLC data for a specified symbol in real-time.
+        Returns a generator that yields OHLC data for one or more symbols in real-time.
+
+        All symbols share this instance's WebSocket connection and a single chart
+        session; the series of the n-th symbol is reported as 'sds_<n>' (starting at 1).
 
         Args:
-            exchange_symbol (str): The symbol in the format 'EXCHANGE:SYMBOL'.
+            exchange_symbol (str or List[str]): A symbol or a list of symbols in the
+                                                format 'EXCHANGE:SYMBOL'.
 
         Returns:
             generator: A generator yielding OHLC data as JSON objects.
         """
         self.validate_symbols(exchange_symbol)
+        if isinstance(exchange_symbol, str):
+            exchange_symbol = [exchange_symbol]
+
         quote_session = self.generate_session(prefix="qs_")
         chart_session = self.generate_session(prefix="cs_")
-        logging.info(f"Quote session generated: {quote_session}, Chart session generated: {chart_session}")
-
-        self._initialize_sessions(quote_session, chart_session)
-        self._add_symbol_to_sessions(quote_session, chart_session, exchange_symbol)
+        logger.info("Quote session generated: %s, Chart session generated: %s", quote_session, chart_session)
+
+        messages = self._initialize_sessions(quote_session, chart_session)
+        for series_index, symbol in enumerate(exchange_symbol, start=1):
+            messages += self._add_symbol_to_sessions(quote_session, chart_session, symbol, series_index)
+        # Each quote_fast_symbols call replaces the fast list, so every symbol goes in a single one
+        messages += [
+            ("quote_fast_symbols", [quote_session, *exchange_symbol]),
+            ("quote_hibernate_all", [quote_session]),
+        ]
+        self.send_batch(messages)
         
         return self.get_data()
 
-    def _initialize_sessions(self, quote_session: str, chart_session: str):
+    def _initialize_sessions(self, quote_session: str, chart_session: str) -> list:
+        """
+        Builds the messages that initialize the WebSocket sessions for quotes and charts.
+        """
+        return [
+            _SET_AUTH_TOKEN_MESSAGE,
+            _SET_LOCALE_MESSAGE,
+            ("chart_create_session", [chart_session, ""]),
+            ("quote_create_session", [quote_session]),
+            self._quote_set_fields_message(quote_session),
+            ("quote_hibernate_all", [quote_session]),
+        ]
+
+    def _quote_set_fields_message(self, quote_session: str) -> bytes:
         """
-        Initializes the WebSocket sessions for quotes and charts.
+        Builds the framed 'quote_set_fields' message for a quote session from the
+        field list serialized once at class creation.
         """
-        self.send_message("set_auth_token", ["unauthorized_user_token"])
-        self.send_message("set_locale", ["en", "US"])
-        self.send_message("chart_create_session", [chart_session, ""])
-        self.send_message("quote_create_session", [quote_session])
-        self.send_message("quote_set_fields", [quote_session, *self._get_quote_fields()])
-        self.send_message("quote_hibernate_all", [quote_session])
+        payload = b'{"m":"quote_set_fields","p":[%b,%b]}' % (json_dumps_bytes(quote_session), self._QUOTE_FIELDS_JSON)
+        return _frame(payload)
 
-    def _get_quote_fields(self):
+    def _create_study_message(self, chart_session: str, study_id: str, series_id: str) -> bytes:
         """
-        Returns the fields to be set for the quote session.
-        
-        Returns:
-            list: A list of fields for the quote session.
+        Builds the framed 'create_study' message that attaches the Volume study
+        to a chart series.
         """
-        return ["ch", "chp", "current_session", "description", "local_description", 
-                "language", "exchange", "fractional", "is_tradable", "lp", 
-                "lp_time", "minmov", "minmove2", "original_name", "pricescale", 
-                "pro_name", "short_name", "type", "update_mode", "volume", 
-                "currency_code", "rchp", "rtc"]
+        ids = json_dumps_bytes([chart_session, study_id, study_id, series_id])[1:-1]
+        return _frame(b'{"m":"create_study","p":[%b,%b]}' % (ids, self._VOLUME_STUDY_JSON))
 
-    def _add_symbol_to_sessions(self, quote_session: str, chart_session: str, exchange_symbol: str):
+    def _add_symbol_to_sessions(self, quote_session: str, chart_session: str, exchange_symbol: str,
+                                series_index: int = 1) -> list:
         """
-        Adds the specified symbol to the quote and chart sessions.
+        Builds the messages that add the specified symbol to the quote and chart
+        sessions, as the chart series number `series_index`. The caller sends
+        quote_fast_symbols once for all symbols afterwards.
         """
-        resolve_symbol = json.dumps({"adjustment": "splits", "symbol": exchange_symbol})
-        self.send_message("quote_add_symbols", [quote_session, f"={resolve_symbol}"])
-        self.send_message("resolve_symbol", [chart_session, "sds_sym_1", f"={resolve_symbol}"])
-        self.send_message("create_series", [chart_session, "sds_1", "s1", "sds_sym_1", "1", 10, ""])
-        self.send_message("quote_fast_symbols", [quote_session, exchange_symbol])
-        self.send_message("create_study", [chart_session, "st1", "st1", "sds_1", 
-                            "Volume@tv-basicstudies-246", {"length": 20, "col_prev_close": "false"}])
-        self.send_message("quote_hibernate_all", [quote_session])
+        symbol_id = f"sds_sym_{series_index}"
+        series_id = f"sds_{series_index}"
+        study_id = f"st{series_index}"
+        resolve_symbol = _resolve_symbol_json(exchange_symbol)
+        return [
+            ("quote_add_symbols", [quote_session, f"={resolve_symbol}"]),
+            ("resolve_symbol", [chart_session, symbol_id, f"={resolve_symbol}"]),
+            ("create_series", [chart_session, series_id, f"s{series_index}", symbol_id, "1", 10, ""]),
+            self._create_study_message(chart_session, study_id, series_id),
+        ]
 
         
     def get_latest_trade_info(self, exchange_symbol: List[str]):
@@ -225,24 +396,66 @@ class RealTimeData:
         """
         quote_session = self.generate_session(prefix="qs_")
         chart_session = self.generate_session(prefix="cs_")
-        logging.info(f"Session generated: {quote_session}, Chart session generated: {chart_session}")
+        logger.info("Session generated: %s, Chart session generated: %s", quote_session, chart_session)
 
-        self._initialize_sessions(quote_session, chart_session)
-        self._add_multiple_symbols_to_sessions(quote_session, exchange_symbol)
+        self.send_batch(self._initialize_sessions(quote_session, chart_session)
+                        + self._add_multiple_symbols_to_sessions(quote_session, exchange_symbol))
 
         return self.get_data()
 
-    def _add_multiple_symbols_to_sessions(self, quote_session: str, exchange_symbols: List[str]):
+    def _add_multiple_symbols_to_sessions(self, quote_session: str, exchange_symbols: List[str]) -> list:
         """
-        Adds multiple symbols to the quote session.
+        Builds the messages that add multiple symbols to the quote session.
         """
-        resolve_symbol = json.dumps({"adjustment": "splits", "currency-id": "USD", "session": "regular", "symbol": exchange_symbols[0]})
-        self.send_message("quote_add_symbols", [quote_session, f"={resolve_symbol}"])
-        self.send_message("quote_fast_symbols", [quote_session, f"={resolve_symbol}"])
-        
-        self.send_message("quote_add_symbols", [quote_session]+exchange_symbols)
-        self.send_message("quote_fast_symbols", [quote_session]+exchange_symbols)
+        resolve_symbol = json_dumps({"adjustment": "splits", "currency-id": "USD", "session": "regular", "symbol": exchange_symbols[0]})
+        return [
+            ("quote_add_symbols", [quote_session, f"={resolve_symbol}"]),
+            ("quote_fast_symbols", [quote_session, f"={resolve_symbol}"]),
+            ("quote_add_symbols", [quote_session]+exchange_symbols),
+            ("quote_fast_symbols", [quote_session]+exchange_symbols),
+        ]
+
+
+    def _has_pending_data(self) -> bool:
+        """
+        Checks whether bytes are waiting on the WebSocket. This does not mean a
+        whole message has arrived, only that a read will start right away.
+        """
+        sock = self.ws.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.pending():
+            return True
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+
+    def _drain(self) -> str:
+        """
+        Blocks for the next WebSocket message, then keeps reading while bytes are
+        already waiting on the socket so the messages can be parsed in one pass.
+
+        Waiting bytes may be only part of a message, in which case the follow-up
+        read still waits for the rest of it. Draining stops at the first control
+        frame (ping, pong or close), so messages already read are not held back
+        until the next data message. If a follow-up read fails, the messages
+        already read are returned first and the error is raised by the next call.
 
+        Returns:
+            str: The concatenated framed messages.
+        """
+        if self._drain_error is not None:
+            error, self._drain_error = self._drain_error, None
+            raise error
+
+        messages = [self.ws.recv()]
+        try:
+            while self._has_pending_data():
+                # Unlike recv(), this returns control frames instead of reading past them
+                opcode, frame = self.ws.recv_data_frame(control_frame=True)
+                if opcode != ABNF.OPCODE_TEXT:
+                    break
+                messages.append(frame.data.decode())
+        except Exception as e:
+            self._drain_error = e
+        return "".join(messages)
 
     def get_data(self):
         """
@@ -254,28 +467,63 @@ class RealTimeData:
         try:
             while True:
                 try:
-                    sleep(1)
-                    result = self.ws.recv()
-                    # Check if the result is a heartbeat or actual data
-                    if re.match(r"~m~\d+~m~~h~\d+$", result):
-                        self.ws.recv()  # Echo back the message
-                        logging.debug(f"Received heartbeat: {result}")
-                        self.ws.send(result)
-                    else:
-                        split_result = [x for x in re.split(r'~m~\d+~m~', result) if x]
-                        for item in split_result:
-                            if item:
-                                yield json.loads(item)  # Yield parsed JSON data
+                    for payload in _iter_frames(self._drain()):
+                        # Check if the payload is a heartbeat or actual data
+                        if payload.startswith("~h~"):
+                            logger.debug("Received heartbeat: %s", payload)
+                            self.ws.send(_frame(payload.encode()))  # Echo back the message
+                        else:
+                            yield json_loads(payload)  # Yield parsed JSON data
 
                 except WebSocketConnectionClosedException:
-                    logging.error("WebSocket connection closed. Attempting to reconnect...")
+                    logger.error("WebSocket connection closed. Attempting to reconnect...")
                     break  # Handle reconnection logic as needed
                 except Exception as e:
-                    logging.error(f"An error occurred: {e}")
+                    logger.error("An error occurred: %s", e)
                     break  # Handle other exceptions as needed
         finally:
             self.ws.close()
 
+    async def get_data_async(self):
+        """
+        Asynchronously receives data from the TradingView server, for use inside an event loop.
+
+        The blocking reads of `get_data` run on a thread dedicated to this
+        stream, so several RealTimeData instances can be consumed side by side
+        from one event loop (e.g. with asyncio.gather) without tying up the
+        loop's default executor. Subscribe first with `get_ohlcv`
+        or `get_latest_trade_info` (which block, so call them from the executor
+        as well), then iterate over this generator instead of the one they return.
+
+        Yields:
+            dict: Parsed JSON data received from the server.
+        """
+        loop = asyncio.get_running_loop()
+        # One thread per stream: a blocked recv() must not hold a worker of the shared default executor
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tradingview-stream")
+        packets = self.get_data()
+        reading = False
+        try:
+            while True:
+                reading = True
+                packet = await loop.run_in_executor(executor, next, packets, _END)
+                reading = False
+                if packet is _END:
+                    break
+                yield packet
+        finally:
+            if reading:
+                # A read is still blocked in the executor: shut the socket down so it fails
+                # right away and get_data cleans up in that thread
+                try:
+                    socket.socket.shutdown(self.ws.sock, socket.SHUT_RDWR)
+                except (OSError, TypeError):
+                    pass
+            else:
+                # Runs get_data's cleanup, including the blocking close handshake, off the loop thread
+                await loop.run_in_executor(executor, packets.close)
+            executor.shutdown(wait=False)
+
         
 # Signal handler for keyboard interrupt
 def signal_handler(sig, frame):
@@ -286,17 +534,20 @@ def signal_handler(sig, frame):
         sig: The signal number.
         frame: The current stack frame.
     """
-    logging.info("Keyboard interrupt received. Closing WebSocket connection.")
+    logger.info("Keyboard interrupt received. Closing WebSocket connection.")
     exit(0)
 
 
-# Register the signal handler
-signal.signal(signal.SIGINT, signal_handler)
-
-
 
 # Example Usage
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.DEBUG,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # Register the signal handler
+    signal.signal(signal.SIGINT, signal_handler)
+
     real_time_data = RealTimeData()
 
     exchange_symbol = ["BINANCE:BTCUSDT", "BINANCE:ETHUSDT", "FXOPEN:XAUUSD"]  # Example symbol
@@ -306,7 +557,11 @@ if __name__ == "__main__":
     # data_generator = real_time_data.get_ohlcv(exchange_symbol="BINANCE:BTCUSDT")
 
     # Iterate over the generator to get real-time data
-    for packet in data_generator:
-        print('-'*50)
-        print(packet)
+    try:
+        for packet in data_generator:
+            print('-'*50)
+            print(packet)
+    finally:
+        # Runs the generator's cleanup even if the interrupt lands outside of it, closing the socket
+        data_generator.close()
 
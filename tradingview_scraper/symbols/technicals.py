@@ -1,20 +1,58 @@
+import asyncio
+import functools
 import requests
-import pkg_resources
-import os
-import re
-import json
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import FrozenSet, List, Mapping, Optional, Tuple
+
+from tradingview_scraper.symbols._cache import TTLCache
+from tradingview_scraper.symbols.utils import (
+    save_json_file, save_csv_file, get_session, json_loads,
+    load_indicators, load_exchanges, load_timeframes
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _indicator_fields(indicators: Tuple[str, ...], timeframe: str) -> str:
+    """Builds the scanner `fields` parameter once per indicators and timeframe combination.
+
+    Args:
+        indicators (Tuple[str, ...]): The indicator names.
+        timeframe (str): The timeframe to append to each indicator.
+
+    Returns:
+        str: A comma-separated string of indicators with the timeframe appended.
+    """
+    timeframe_value = load_timeframes().get(timeframe)
+    if timeframe == '1d' or not timeframe_value:
+        return ','.join(indicators)
+    return ','.join(f'{ind}|{timeframe_value}' for ind in indicators)
 
-from tradingview_scraper.symbols.utils import generate_user_agent, save_json_file, save_csv_file
 
 class Indicators:
-    def __init__(self, export_result: bool = False, export_type: str = 'json'):
+    __slots__ = ('export_result', 'export_type', '_cache', 'indicators', 'exchanges', 'timeframes')
+
+    def __init__(
+        self,
+        export_result: bool = False,
+        export_type: str = 'json',
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = 1024,
+    ):
+        """
+        Args:
+            export_result (bool): Whether to export every scraped result to a file (default is False).
+            export_type (str): The export format, 'json' or 'csv' (default is 'json').
+            cache_ttl (Optional[float]): If set, scanner responses are reused for this many
+                seconds for the same exchange, symbol and fields (default is None, no caching).
+            cache_maxsize (int): The maximum number of cached responses (default is 1024).
+        """
         self.export_result: bool = export_result
         self.export_type: str = export_type
+        self._cache: Optional[TTLCache] = TTLCache(cache_ttl, cache_maxsize) if cache_ttl else None
         
-        self.indicators: List[str] = self._load_indicators()
-        self.exchanges: List[str] = self._load_exchanges()
-        self.timeframes: dict = self._load_timeframes()
+        self.indicators: Tuple[str, ...] = load_indicators()
+        self.exchanges: FrozenSet[str] = load_exchanges()
+        self.timeframes: Mapping[str, str] = load_timeframes()
 
 
     def _validate_timeframe(self, timeframe: str) -> None:
@@ -41,15 +79,7 @@ class Indicators:
         Returns:
             str: A comma-separated string of revised indicators with timeframes appended.
         """
-        if timeframe == '1d':
-            return ','.join(indicators)
-
-        timeframe_value = self.timeframes.get(timeframe)
-        if timeframe_value:
-            revised_indicators = [f'{ind}|{timeframe_value}' for ind in indicators]
-            return ','.join(revised_indicators)
-        
-        return ','.join(indicators)
+        return _indicator_fields(tuple(indicators), timeframe)
         
             
     def scrape(
@@ -76,6 +106,98 @@ class Indicators:
             ValueError: If the specified exchange or indicators are not supported.
             requests.RequestException: If there is an error during the HTTP request.
         """
+        fields = self._prepare_fields(exchange, timeframe, indicators, allIndicators)
+        return self._fetch(exchange, symbol, fields)
+
+
+    def scrape_many(
+        self,
+        symbols: List[str],
+        exchange: str = "BITSTAMP",
+        timeframe: str = "1d",
+        indicators: Optional[List[str]] = None,
+        allIndicators: bool = False,
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """Scrape the same indicators for several symbols using a thread pool.
+
+        This is the synchronous counterpart of `scrape_many_async` for code that
+        does not run an event loop. Keep `max_workers` at or below the pool size
+        of the shared HTTP session (20) so every worker reuses a connection.
+
+        Args:
+            symbols (List[str]): The symbols to scrape data for.
+            exchange (str): The exchange to scrape data from (default is "BITSTAMP").
+            timeframe (str): A timeframe. (default is "1d").
+            indicators (Optional[List[str]]): A list of indicators to scrape (default is None).
+            allIndicators (bool): If True, scrape all indicators (default is False).
+            max_workers (int): The number of worker threads (default is 8).
+
+        Returns:
+            List[dict]: One result per symbol, in the same order and format as `scrape`.
+
+        Raises:
+            ValueError: If the specified exchange, timeframe or indicators are not supported.
+        """
+        fields = self._prepare_fields(exchange, timeframe, indicators, allIndicators)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda symbol: self._fetch(exchange, symbol, fields), symbols))
+
+
+    async def scrape_many_async(
+        self,
+        symbols: List[str],
+        exchange: str = "BITSTAMP",
+        timeframe: str = "1d",
+        indicators: Optional[List[str]] = None,
+        allIndicators: bool = False,
+        concurrency: int = 8,
+    ) -> List[dict]:
+        """Scrape the same indicators for several symbols concurrently.
+
+        The requests are issued from the default executor through the shared
+        HTTP session, with at most ``concurrency`` of them in flight at once.
+
+        Args:
+            symbols (List[str]): The symbols to scrape data for.
+            exchange (str): The exchange to scrape data from (default is "BITSTAMP").
+            timeframe (str): A timeframe. (default is "1d").
+            indicators (Optional[List[str]]): A list of indicators to scrape (default is None).
+            allIndicators (bool): If True, scrape all indicators (default is False).
+            concurrency (int): The maximum number of concurrent requests (default is 8).
+
+        Returns:
+            List[dict]: One result per symbol, in the same order and format as `scrape`.
+                A symbol whose request raised is reported as ``{"status": "failed"}``.
+
+        Raises:
+            ValueError: If the specified exchange, timeframe or indicators are not supported.
+        """
+        fields = self._prepare_fields(exchange, timeframe, indicators, allIndicators)
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(symbol: str) -> dict:
+            async with semaphore:
+                return await loop.run_in_executor(None, self._fetch, exchange, symbol, fields)
+
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        # An unexpected error for one symbol must not discard the results of the others
+        return [{"status": "failed"} if isinstance(result, Exception) else result for result in results]
+
+
+    def _prepare_fields(
+        self,
+        exchange: str,
+        timeframe: str,
+        indicators: Optional[List[str]],
+        allIndicators: bool,
+    ) -> str:
+        """Validates the request arguments and builds the scanner `fields` parameter.
+
+        Raises:
+            ValueError: If the specified exchange, timeframe or indicators are not supported.
+        """
         self._validate_timeframe(timeframe)
 
         if exchange not in self.exchanges:
@@ -91,31 +213,45 @@ class Indicators:
                                 "Please check the list of supported indicators at the following link:\n"
                                 "https://github.com/mnwato/tradingview-scraper/blob/main/tradingview_scraper/data/indicators.txt")
         else:
-            indicators = self.indicators
+            return _indicator_fields(self.indicators, timeframe)
 
-        base_url = "https://scanner.tradingview.com/symbol"
-        fields = self._edit_indicators_by_specified_timeframe(indicators, timeframe)
-        url = f"{base_url}?symbol={exchange}:{symbol}&fields={fields}&no_404=true"
-        headers = {'user-agent': generate_user_agent()}
+        return self._edit_indicators_by_specified_timeframe(indicators, timeframe)
 
-        try:
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                json_response = response.json()
+
+    def _fetch(self, exchange: str, symbol: str, fields: str) -> dict:
+        """Requests the given fields for a single symbol from the scanner.
+
+        Returns:
+            dict: The scraped data, or ``{"status": "failed"}`` if the request fails.
+        """
+        cache_key = (exchange, symbol, fields)
+        json_response = self._cache.get(cache_key) if self._cache is not None else None
+
+        if json_response is None:
+            base_url = "https://scanner.tradingview.com/symbol"
+            url = f"{base_url}?symbol={exchange}:{symbol}&fields={fields}&no_404=true"
+
+            try:
+                response = get_session().get(url)
+
+                if response.status_code != 200:
+                    return {"status": "failed"}
+
+                json_response = json_loads(response.content)
                 if not json_response:
                     return {"status": "failed"}
-                
-                if self.export_result:
-                    self._export(data=[json_response], symbol=symbol)
-                return {"status": "success", "data": self.revise_response(json_response)}
-            
-            else:
+
+            except (requests.RequestException, ValueError) as e:
+                # ValueError covers a 200 response whose body is not JSON (e.g. a captcha page)
+                print(f"[ERROR] Failed to scrape data: {e}")
                 return {"status": "failed"}
-            
-        except requests.RequestException as e:
-            print(f"[ERROR] Failed to scrape data: {e}")
-            return {"status": "failed"}
+
+            if self._cache is not None:
+                self._cache.set(cache_key, json_response)
+
+        if self.export_result:
+            self._export(data=[json_response], symbol=symbol)
+        return {"status": "success", "data": self.revise_response(json_response)}
 
 
     def revise_response(self, json_response: dict) -> dict:
@@ -127,7 +263,7 @@ class Indicators:
         Returns:
             dict: The revised response with cleaned keys.
         """
-        return {re.sub(r'\|.*', '', k): v for k, v in json_response.items()}
+        return {k.partition('|')[0]: v for k, v in json_response.items()}
             
 
     def _export(self, data: List[dict], symbol: str) -> None:
@@ -141,56 +277,3 @@ class Indicators:
             save_json_file(data=data, symbol=symbol, data_category='indicators')
         elif self.export_type == "csv":
             save_csv_file(data=data, symbol=symbol, data_category='indicators')
-            
-                
-    def _load_indicators(self) -> List[str]:
-        """Load indicators from a specified file.
-
-        Returns:
-            List[str]: A list of indicators loaded from the file. Returns an empty list if the file is not found.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/indicators.txt')
-        if not os.path.exists(path):
-            print(f"[ERROR] Indicators file not found at {path}.")
-            return []
-        try:
-            with open(path, 'r') as f:
-                return [indicator.strip() for indicator in f.readlines()]
-        except IOError as e:
-            print(f"[ERROR] Error reading indicators file: {e}")
-            return []
-
-    def _load_exchanges(self) -> List[str]:
-        """Load exchanges from a specified file.
-
-        Returns:
-            List[str]: A list of exchanges loaded from the file. Returns an empty list if the file is not found.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/exchanges.txt')
-        if not os.path.exists(path):
-            print(f"[ERROR] Exchanges file not found at {path}.")
-            return []
-        try:
-            with open(path, 'r') as f:
-                return [exchange.strip() for exchange in f.readlines()]
-        except IOError as e:
-            print(f"[ERROR] Error reading exchanges file: {e}")
-            return []
-
-    def _load_timeframes(self) -> dict:
-        """Load timeframes from a specified file.
-
-        Returns:
-            dict: A dictionary of timeframes loaded from the file. Returns a dict with '1d' as default.
-        """
-        path = pkg_resources.resource_filename('tradingview_scraper', 'data/timeframes.json')
-        if not os.path.exists(path):
-            print(f"[ERROR] Timeframe file not found at {path}.")
-            return {"1d": None}
-        try:
-            with open(path, 'r') as f:
-                timeframes = json.load(f)
-            return timeframes.get('indicators', {"1d": None})
-        except IOError as e:
-            print(f"[ERROR] Error reading timeframe file: {e}")
-            return {"1d": None}
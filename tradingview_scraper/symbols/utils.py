@@ -1,8 +1,39 @@
 import os
+import csv
 import json
-import pandas as pd
+import logging
+import functools
 import random
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    _json_dumps_bytes = orjson.dumps
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+    def _json_dumps_bytes(obj):
+        return _json_dumps(obj).encode()
+
+
+logger = logging.getLogger(__name__)
+
+# tradingview_scraper/data, resolved without pkg_resources so importing utils stays cheap
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
 
 def ensure_export_directory(path='/export'):
     """Check if the export directory exists, and create it if it does not.
@@ -83,8 +114,13 @@ def save_json_file(data, symbol, data_category):
     output_path = generate_export_filepath(symbol, data_category, '.json')
     ensure_export_directory(os.path.dirname(output_path))  # Ensure the directory exists
     try:
-        with open(output_path, 'w') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # Serialized in C straight to UTF-8 bytes, same layout as json.dump(indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"[INFO] JSON file saved at: {output_path}")
     except FileNotFoundError:
         print(f"[ERROR] Error: The directory for {output_path} does not exist.")
@@ -126,6 +162,8 @@ def save_csv_file(data, symbol, data_category):
     """
     output_path = generate_export_filepath(symbol, data_category, '.csv')
     ensure_export_directory(os.path.dirname(output_path))  # Ensure the directory exists
+    import pandas as pd  # Imported lazily so the streaming modules do not pay for pandas
+
     try:
         df = pd.DataFrame.from_dict(data)
         df.to_csv(output_path, index=False)
@@ -139,6 +177,79 @@ def save_csv_file(data, symbol, data_category):
     except Exception as e:
         print(f"[ERROR] An unexpected error occurred: {e}")
 
+def save_json_stream(rows, symbol, data_category):
+    """Write rows to a JSON file as they are produced, without materializing them.
+
+    The output is a JSON array like the one written by ``save_json_file``, with
+    one row per line, so it can be loaded the same way.
+
+    Parameters
+    ----------
+    rows : iterable of dict
+        The rows to write, e.g. a scraper generator. Each row must be serializable to JSON.
+    symbol : str
+        The symbol to include in the file name, which will be formatted to lowercase.
+    data_category : str
+        The category of data being exported, which will be prefixed in the file name.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    output_path = generate_export_filepath(symbol, data_category, '.json')
+    ensure_export_directory(os.path.dirname(output_path))  # Ensure the directory exists
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for row in rows:
+            f.write(',\n' if count else '\n')
+            f.write(json_dumps(row))
+            count += 1
+        f.write('\n]\n' if count else ']\n')
+    print(f"[INFO] JSON file saved at: {output_path}")
+    return count
+
+def save_csv_stream(rows, symbol, data_category):
+    """Write rows to a CSV file as they are produced, without materializing them.
+
+    The columns are taken from the keys of the first row; keys that only appear
+    in later rows are dropped, with a warning logged once per dropped key.
+
+    Parameters
+    ----------
+    rows : iterable of dict
+        The rows to write, e.g. a scraper generator.
+    symbol : str
+        The symbol to include in the file name, which will be formatted to lowercase.
+    data_category : str
+        The category of data being exported, which will be prefixed in the file name.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    output_path = generate_export_filepath(symbol, data_category, '.csv')
+    ensure_export_directory(os.path.dirname(output_path))  # Ensure the directory exists
+    count = 0
+    dropped = set()
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row), extrasaction='ignore')
+                writer.writeheader()
+            extra = row.keys() - writer.fieldnames - dropped
+            if extra:
+                logger.warning("Dropping CSV columns missing from the header of %s: %s",
+                               output_path, ', '.join(sorted(map(str, extra))))
+                dropped |= extra
+            writer.writerow(row)
+            count += 1
+    print(f"[INFO] CSV file saved at: {output_path}")
+    return count
+
 def generate_user_agent():
     """
     Generates a random user agent string from a predefined list of Google bot user agents.
@@ -157,4 +268,191 @@ def generate_user_agent():
         "Mozilla/5.0 (compatible; Google-Site-Verification/1.0; +http://www.google.com/bot.html)"
     ]
     
-    return random.choice(user_agents)
\ No newline at end of file
+    return random.choice(user_agents)
+
+def json_loads(data):
+    """Deserialize a JSON document, using ``orjson`` when it is installed.
+
+    Parameters
+    ----------
+    data : bytes or str
+        The JSON document, e.g. ``response.content``.
+
+    Returns
+    -------
+    object
+        The decoded Python object.
+    """
+    return _json_loads(data)
+
+
+def json_dumps(obj):
+    """Serialize an object to a compact JSON string, using ``orjson`` when it is installed.
+
+    Parameters
+    ----------
+    obj : object
+        The object to serialize.
+
+    Returns
+    -------
+    str
+        The JSON document without insignificant whitespace.
+    """
+    return _json_dumps(obj)
+
+
+def json_dumps_bytes(obj):
+    """Serialize an object to compact UTF-8 encoded JSON, using ``orjson`` when it is installed.
+
+    Parameters
+    ----------
+    obj : object
+        The object to serialize.
+
+    Returns
+    -------
+    bytes
+        The JSON document without insignificant whitespace.
+    """
+    return _json_dumps_bytes(obj)
+
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """Return the HTTP session shared by all scrapers in this process.
+
+    Reusing one ``requests.Session`` keeps connections to TradingView alive
+    between calls instead of paying a new TCP/TLS handshake per request.
+    Transient failures (429 and 5xx) are retried up to 3 times with exponential
+    backoff, honouring ``Retry-After``; the last response is returned as-is so
+    callers keep handling the status code themselves.
+
+    Returns
+    -------
+    requests.Session
+        A session with a pooled, retrying HTTPS adapter and a random Google bot user agent.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    session.headers.update({"User-Agent": generate_user_agent()})
+    return session
+
+
+def _read_data_file(filename, parse):
+    """Read a file bundled in the package ``data`` directory.
+
+    Parameters
+    ----------
+    filename : str
+        The file name relative to ``tradingview_scraper/data``.
+    parse : callable
+        A function receiving the open file object and returning the parsed content.
+
+    Returns
+    -------
+    object
+        The value returned by ``parse``.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the data file does not exist.
+    IOError
+        If there is an error reading the file.
+    """
+    path = os.path.join(_DATA_DIR, filename)
+    if not os.path.exists(path):
+        logger.error("Data file not found at %s.", path)
+        raise FileNotFoundError(f"Data file not found at {path}.")
+    try:
+        with open(path, 'r') as f:
+            return parse(f)
+    except IOError as e:
+        logger.error("Error reading data file %s: %s", path, e)
+        raise
+
+
+def _read_lines(f):
+    return [line.strip() for line in f.readlines()]
+
+
+@functools.lru_cache(maxsize=1)
+def load_exchanges():
+    """Load the supported exchanges once per process.
+
+    Returns
+    -------
+    frozenset
+        The supported exchange names.
+    """
+    return frozenset(_read_data_file('exchanges.txt', _read_lines))
+
+
+@functools.lru_cache(maxsize=1)
+def load_indicators():
+    """Load the supported indicators once per process.
+
+    Returns
+    -------
+    tuple
+        The supported indicator names, in file order.
+    """
+    return tuple(_read_data_file('indicators.txt', _read_lines))
+
+
+@functools.lru_cache(maxsize=1)
+def load_news_providers():
+    """Load the supported news providers once per process.
+
+    Returns
+    -------
+    frozenset
+        The supported news provider names.
+    """
+    return frozenset(_read_data_file('news_providers.txt', _read_lines))
+
+
+@functools.lru_cache(maxsize=1)
+def load_languages():
+    """Load the supported language codes once per process.
+
+    Returns
+    -------
+    frozenset
+        The supported language codes.
+    """
+    return frozenset(_read_data_file('languages.json', json.load).values())
+
+
+@functools.lru_cache(maxsize=1)
+def load_areas():
+    """Load the news areas once per process.
+
+    Returns
+    -------
+    Mapping
+        A read-only mapping of area names to TradingView area codes.
+    """
+    return MappingProxyType(_read_data_file('areas.json', json.load))
+
+
+@functools.lru_cache(maxsize=1)
+def load_timeframes():
+    """Load the indicator timeframes once per process.
+
+    Returns
+    -------
+    Mapping
+        A read-only mapping of timeframes to TradingView interval suffixes.
+    """
+    timeframes = _read_data_file('timeframes.json', json.load)
+    return MappingProxyType(timeframes.get('indicators', {"1d": None}))